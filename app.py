@@ -1,19 +1,51 @@
-import resend
+import asyncio
+import logging
 import os
-from typing import Dict, Optional
-from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import AsyncIterator, Dict, Optional, Sequence, Union
+import httpx
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, EmailStr
+from fastapi.responses import Response
+from pydantic import BaseModel, ConfigDict, EmailStr, TypeAdapter, ValidationError
 from dotenv import load_dotenv
+from jinja2 import Environment, FileSystemLoader, select_autoescape
 load_dotenv()
-# Use environment variable for API key with fallback to hardcoded (for dev)
-resend.api_key = os.getenv("RESEND_API_KEY")
 
-app = FastAPI(title="Raju Visuals Email API")
+logger = logging.getLogger(__name__)
+
+# Shared async client for the Resend REST API (pooled, non-blocking)
+_resend = httpx.AsyncClient(
+    base_url="https://api.resend.com",
+    headers={"Authorization": f"Bearer {os.getenv('RESEND_API_KEY')}"},
+    timeout=10.0,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Close the shared Resend client on shutdown."""
+    yield
+    await _resend.aclose()
+
+
+app = FastAPI(title="Raju Visuals Email API", lifespan=lifespan)
+
+
+class FrozenOriginCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware with O(1) origin lookups against a frozenset."""
+
+    def __init__(self, app, allow_origins: Sequence[str] = (), **kwargs) -> None:
+        super().__init__(app, allow_origins=allow_origins, **kwargs)
+        self.allow_origins = frozenset(allow_origins)
+
 
 # Configure CORS for frontend connectivity
 app.add_middleware(
-    CORSMiddleware,
+    FrozenOriginCORSMiddleware,
     allow_origins=[
         "https://rajuvisuals.com",    # Production domain
         "https://www.rajuvisuals.com", # Production with www
@@ -30,6 +62,8 @@ app.add_middleware(
 # ============ PYDANTIC MODELS ============
 
 class ContactFormRequest(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
+
     from_name: str
     from_email: EmailStr
     subject: str
@@ -38,263 +72,53 @@ class ContactFormRequest(BaseModel):
 
 
 class ContactFormResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     success: bool
     message: str
     skipped: bool = False
     error: Optional[str] = None
 
 
+# Validates raw request bodies directly with pydantic-core
+_CONTACT_ADAPTER = TypeAdapter(ContactFormRequest)
+
+# Pre-serialized bodies for the two fixed success responses. Only the bytes
+# are shared: FastAPI attaches background tasks to the returned Response, so
+# each request still gets its own Response object.
+_SKIPPED_BODY = ContactFormResponse(
+    success=True,
+    message="Email sending is disabled. Form data saved.",
+    skipped=True
+).model_dump_json().encode()
+_SENT_BODY = ContactFormResponse(
+    success=True,
+    message="Emails queued for delivery"
+).model_dump_json().encode()
+
+
 # ============ EMAIL TEMPLATES ============
 
+# Compiled once and kept in memory; autoescape covers every user-supplied field
+_templates = Environment(
+    loader=FileSystemLoader(Path(__file__).parent / "templates"),
+    auto_reload=False,
+    cache_size=-1,
+    autoescape=select_autoescape(["html"]),
+)
+_USER_TPL = _templates.get_template("user_confirm.html")
+_ADMIN_TPL = _templates.get_template("admin_notify.html")
+
+
+@lru_cache(maxsize=4096)
 def get_user_confirmation_html(name: str) -> str:
-    """Generate HTML email for user confirmation."""
-    return f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <style>
-            @keyframes fadeInDown {{
-                from {{
-                    opacity: 0;
-                    transform: translateY(-20px);
-                }}
-                to {{
-                    opacity: 1;
-                    transform: translateY(0);
-                }}
-            }}
-            
-            @keyframes fadeInUp {{
-                from {{
-                    opacity: 0;
-                    transform: translateY(20px);
-                }}
-                to {{
-                    opacity: 1;
-                    transform: translateY(0);
-                }}
-            }}
-            
-            @keyframes fadeIn {{
-                from {{
-                    opacity: 0;
-                }}
-                to {{
-                    opacity: 1;
-                }}
-            }}
-            
-            @keyframes pulse {{
-                0%, 100% {{
-                    transform: scale(1);
-                }}
-                50% {{
-                    transform: scale(1.05);
-                }}
-            }}
-            
-            @keyframes slideInRight {{
-                from {{
-                    opacity: 0;
-                    transform: translateX(-30px);
-                }}
-                to {{
-                    opacity: 1;
-                    transform: translateX(0);
-                }}
-            }}
-            
-            .animate-header {{
-                animation: fadeInDown 0.8s ease-out;
-            }}
-            
-            .animate-content {{
-                animation: fadeInUp 0.8s ease-out 0.2s both;
-            }}
-            
-            .animate-box {{
-                animation: slideInRight 0.8s ease-out 0.4s both;
-            }}
-            
-            .animate-button {{
-                animation: fadeIn 0.8s ease-out 0.6s both;
-            }}
-            
-            .animate-footer {{
-                animation: fadeInUp 0.8s ease-out 0.7s both;
-            }}
-            
-            .button-hover {{
-                transition: transform 0.3s ease, box-shadow 0.3s ease;
-            }}
-            
-            .button-hover:hover {{
-                transform: translateY(-2px);
-                box-shadow: 0 6px 20px rgba(155, 92, 255, 0.4) !important;
-            }}
-        </style>
-    </head>
-    <body style="margin: 0; padding: 0; background-color: #f4f4f4;">
-        <div style="font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; max-width: 600px; margin: 40px auto; background-color: #ffffff; border-radius: 12px; overflow: hidden; box-shadow: 0 4px 12px rgba(0,0,0,0.1);">
-            
-            <!-- Header -->
-            <div style="background: linear-gradient(135deg, #9B5CFF 0%, #7C3FCC 100%); padding: 40px 30px; text-align: center;">
-                <h1 style="color: #ffffff; margin: 0; font-size: 28px; font-weight: 600; letter-spacing: -0.5px;">
-                    Thanks for Reaching Out! 🎬
-                </h1>
-            </div>
-            
-            <!-- Content -->
-            <div style="padding: 40px 30px;">
-                <p style="color: #333333; font-size: 18px; line-height: 1.8; margin: 0 0 20px 0;">
-                    Hi <strong style="color: #9B5CFF;">{name}</strong>,
-                </p>
-                
-                <p style="color: #555555; font-size: 16px; line-height: 1.8; margin: 0 0 20px 0;">
-                    Your message has been successfully received! I appreciate you taking the time to connect with me.
-                </p>
-                
-                <p style="color: #555555; font-size: 16px; line-height: 1.8; margin: 0 0 30px 0;">
-                    I'll review your inquiry and get back to you within <strong>24-48 hours</strong>. 
-                    If your project is time-sensitive, feel free to mention that in your message.
-                </p>
-                
-                <!-- CTA Box -->
-                <div style="background: linear-gradient(135deg, #f8f4ff 0%, #f0e8ff 100%); border-left: 4px solid #9B5CFF; padding: 20px; border-radius: 8px; margin: 30px 0;">
-                    <p style="color: #333333; font-size: 15px; line-height: 1.6; margin: 0 0 12px 0;">
-                        <strong>While you wait...</strong>
-                    </p>
-                    <p style="color: #555555; font-size: 14px; line-height: 1.6; margin: 0;">
-                        Check out my portfolio and latest projects to see what I can bring to your vision.
-                    </p>
-                </div>
-                
-                <!-- Button -->
-                <div style="text-align: center; margin: 30px 0;">
-                    <a href="https://rajuvisuals.com" style="display: inline-block; background: linear-gradient(135deg, #9B5CFF 0%, #7C3FCC 100%); color: #ffffff; text-decoration: none; padding: 14px 32px; border-radius: 8px; font-weight: 600; font-size: 16px; box-shadow: 0 4px 12px rgba(155, 92, 255, 0.3);">
-                    View Portfolio →
-                    </a>
-                </div>
-            </div>
-            
-            <!-- Footer -->
-            <div style="background-color: #f9f9f9; padding: 30px; border-top: 1px solid #e8e8e8;">
-                <p style="color: #333333; font-size: 16px; margin: 0 0 8px 0; font-weight: 600;">
-                    Best regards,
-                </p>
-                <p style="color: #555555; font-size: 15px; margin: 0 0 4px 0;">
-                    <strong>Raju Dalai</strong>
-                </p>
-                <p style="color: #888888; font-size: 14px; margin: 0;">
-                    Video Editor & Motion Graphics Artist
-                </p>
-            </div>
-            
-            <!-- Bottom bar -->
-            <div style="background-color: #9B5CFF; padding: 15px; text-align: center;">
-                <p style="color: #ffffff; font-size: 12px; margin: 0; opacity: 0.9;">
-                    © 2024 Raju Visuals. All rights reserved.
-                </p>
-            </div>
-            
-        </div>
-    </body>
-    </html>
-    """
+    """Generate HTML email for user confirmation (cached per name for retries/double-submits)."""
+    return _USER_TPL.render(name=name)
 
 
 def get_admin_notification_html(name: str, email: str, subject: str, message: str) -> str:
     """Generate HTML email for admin notification."""
-    return f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    </head>
-    <body style="margin: 0; padding: 0; background-color: #f4f4f4;">
-        <div style="font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; max-width: 650px; margin: 40px auto; background-color: #ffffff; border-radius: 12px; overflow: hidden; box-shadow: 0 4px 12px rgba(0,0,0,0.1);">
-            
-            <!-- Header -->
-            <div style="background: linear-gradient(135deg, #9B5CFF 0%, #7C3FCC 100%); padding: 30px; text-align: center;">
-                <h1 style="color: #ffffff; margin: 0; font-size: 26px; font-weight: 600; letter-spacing: -0.5px;">
-                    📬 New Contact Form Submission
-                </h1>
-                <p style="color: rgba(255,255,255,0.9); margin: 8px 0 0 0; font-size: 14px;">
-                    Received from rajuvisuals.com
-                </p>
-            </div>
-            
-            <!-- Content -->
-            <div style="padding: 35px 30px;">
-                
-                <!-- Contact Info Card -->
-                <div style="background: linear-gradient(135deg, #f8f4ff 0%, #f0e8ff 100%); border-radius: 10px; padding: 25px; margin-bottom: 25px; border: 1px solid #e8d9ff;">
-                    <table style="width: 100%; border-collapse: collapse;">
-                        <tr>
-                            <td style="padding: 8px 0;">
-                                <span style="color: #666666; font-size: 13px; text-transform: uppercase; letter-spacing: 0.5px; font-weight: 600;">From</span>
-                            </td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 0 0 16px 0;">
-                                <span style="color: #333333; font-size: 18px; font-weight: 600;">{name}</span>
-                            </td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 8px 0; border-top: 1px solid rgba(155, 92, 255, 0.2);">
-                                <span style="color: #666666; font-size: 13px; text-transform: uppercase; letter-spacing: 0.5px; font-weight: 600;">Email</span>
-                            </td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 0 0 16px 0;">
-                                <a href="mailto:{email}" style="color: #9B5CFF; font-size: 16px; text-decoration: none; font-weight: 500;">{email}</a>
-                            </td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 8px 0; border-top: 1px solid rgba(155, 92, 255, 0.2);">
-                                <span style="color: #666666; font-size: 13px; text-transform: uppercase; letter-spacing: 0.5px; font-weight: 600;">Subject</span>
-                            </td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 0;">
-                                <span style="color: #333333; font-size: 16px; font-weight: 500;">{subject}</span>
-                            </td>
-                        </tr>
-                    </table>
-                </div>
-                
-                <!-- Message Card -->
-                <div style="background-color: #ffffff; border: 2px solid #e8e8e8; border-radius: 10px; padding: 25px; margin-bottom: 25px;">
-                    <div style="margin-bottom: 12px;">
-                        <span style="color: #666666; font-size: 13px; text-transform: uppercase; letter-spacing: 0.5px; font-weight: 600;">Message</span>
-                    </div>
-                    <div style="color: #333333; font-size: 15px; line-height: 1.7; white-space: pre-wrap;">{message}</div>
-                </div>
-                
-                <!-- Quick Action Button -->
-                <div style="text-align: center; margin-top: 30px;">
-                    <a href="mailto:{email}" style="display: inline-block; background: linear-gradient(135deg, #9B5CFF 0%, #7C3FCC 100%); color: #ffffff; text-decoration: none; padding: 14px 32px; border-radius: 8px; font-weight: 600; font-size: 15px; box-shadow: 0 4px 12px rgba(155, 92, 255, 0.3);">
-                        Reply to {name} →
-                    </a>
-                </div>
-                
-            </div>
-            
-            <!-- Footer -->
-            <div style="background-color: #f9f9f9; padding: 20px 30px; border-top: 1px solid #e8e8e8; text-align: center;">
-                <p style="color: #999999; font-size: 12px; margin: 0; line-height: 1.6;">
-                    This email was automatically generated from the contact form at<br>
-                    <a href="https://rajuvisuals.com" style="color: #9B5CFF; text-decoration: none; font-weight: 500;">rajuvisuals.com</a>
-                </p>
-            </div>
-            
-        </div>
-    </body>
-    </html>
-    """
+    return _ADMIN_TPL.render(name=name, email=email, subject=subject, message=message)
 
 
 # ============ API ENDPOINTS ============
@@ -305,38 +129,96 @@ def health_check() -> Dict:
     return {"status": "ok", "service": "Raju Visuals Email API"}
 
 
-@app.post("/api/contact", response_model=ContactFormResponse)
-async def send_contact_emails(form: ContactFormRequest) -> ContactFormResponse:
+def _is_json_content_type(content_type: str) -> bool:
+    """Return True for application/json and application/*+json media types."""
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type == "application/json" or (
+        media_type.startswith("application/") and media_type.endswith("+json")
+    )
+
+
+async def _send(params: Dict) -> None:
+    """Send a single email through the Resend API."""
+    r = await _resend.post("/emails", json=params)
+    r.raise_for_status()
+
+
+async def _send_both(user_email_params: Dict, admin_email_params: Dict) -> None:
+    """Send the user confirmation and admin notification emails concurrently."""
+    emails = (("user", user_email_params), ("admin", admin_email_params))
+    results = await asyncio.gather(
+        *(_send(params) for _, params in emails), return_exceptions=True
+    )
+
+    # Runs after the response has gone out, so failures can only be logged.
+    # Log each one on its own, with Resend's error body when there is one.
+    for (kind, params), result in zip(emails, results):
+        if isinstance(result, BaseException):
+            detail = result.response.text if isinstance(result, httpx.HTTPStatusError) else ""
+            logger.error(
+                "Failed to send %s email to %s: %s %s",
+                kind, params["to"], result, detail,
+                exc_info=result,
+            )
+
+
+@app.post(
+    "/api/contact",
+    response_model=ContactFormResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": ContactFormRequest.model_json_schema()}},
+        }
+    },
+)
+async def send_contact_emails(
+    request: Request, background_tasks: BackgroundTasks
+) -> Union[Response, ContactFormResponse]:
     """
     Handle contact form submissions.
     
-    Sends two emails:
+    Queues two emails, sent after the response is returned:
     1. Confirmation email to the user
     2. Notification email to the admin (contact@rajuvisuals.com)
     
     If email_enabled is False, skips sending but returns success.
     """
     
+    # Only accept JSON bodies, as FastAPI's Body parsing does. A text/plain POST
+    # is a CORS "simple request" that skips preflight, so this also stops other
+    # sites from triggering emails through their visitors' browsers.
+    if not _is_json_content_type(request.headers.get("content-type", "")):
+        raise RequestValidationError([{
+            "type": "content_type",
+            "loc": ("body",),
+            "msg": "Content-Type must be application/json",
+            "input": request.headers.get("content-type"),
+        }])
+
+    # Parse the body straight from JSON bytes; report errors like FastAPI does
+    try:
+        form = _CONTACT_ADAPTER.validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+        )
+    
     # If emails are disabled, skip sending
     if not form.email_enabled:
-        return ContactFormResponse(
-            success=True,
-            message="Email sending is disabled. Form data saved.",
-            skipped=True
-        )
+        return Response(_SKIPPED_BODY, media_type="application/json")
     
     try:
-        # Send confirmation email to user
-        user_email_params: resend.Emails.SendParams = {
+        # Confirmation email to user
+        user_email_params: Dict = {
             "from": "Raju Visuals <reply@rajuvisuals.com>",
             "to": [form.from_email],
             "subject": "Thanks for reaching out! 🎬",
             "html": get_user_confirmation_html(form.from_name),
         }
-        resend.Emails.send(user_email_params)
         
-        # Send notification email to admin
-        admin_email_params: resend.Emails.SendParams = {
+        # Notification email to admin
+        admin_email_params: Dict = {
             "from": "Contact Form <reply@rajuvisuals.com>",
             "to": ["contact@rajuvisuals.in"],
             "reply_to": form.from_email,
@@ -348,16 +230,15 @@ async def send_contact_emails(form: ContactFormRequest) -> ContactFormResponse:
                 form.message
             ),
         }
-        resend.Emails.send(admin_email_params)
         
-        return ContactFormResponse(
-            success=True,
-            message="Emails sent successfully"
-        )
+        # Send after responding so the client doesn't wait on Resend
+        background_tasks.add_task(_send_both, user_email_params, admin_email_params)
+        
+        return Response(_SENT_BODY, media_type="application/json")
         
     except Exception as e:
         # Log the error for debugging
-        print(f"Email sending error: {str(e)}")
+        logger.error("Email sending error: %s", e)
         
         # Return error response (don't raise HTTPException so form still saves)
         return ContactFormResponse(
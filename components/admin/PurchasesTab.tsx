@@ -2,6 +2,7 @@ import React, { useState, useEffect } from 'react';
 import { db } from '../../firebase';
 import { collection, getDocs, addDoc, updateDoc, deleteDoc, doc, query, orderBy, Timestamp, setDoc } from 'firebase/firestore';
 import { Plus, Edit2, Trash2, Save, X, Download, Calendar, DollarSign, Package, Search, AlertCircle } from 'lucide-react';
+import { generateReceiptId } from '../../utils/purchaseUtils';
 
 /**
  * Purchase interface matching the structure in BoughtAccess page
@@ -93,17 +94,6 @@ const PurchasesTab: React.FC = () => {
         setShowForm(false);
     };
 
-    /**
-     * Generates a unique receipt ID using timestamp and random characters
-     * Format: RCP-YYYYMMDD-XXXX
-     */
-    const generateReceiptId = () => {
-        const date = new Date();
-        const dateStr = date.toISOString().slice(0, 10).replace(/-/g, '');
-        const randomStr = Math.random().toString(36).substring(2, 6).toUpperCase();
-        return `RCP-${dateStr}-${randomStr}`;
-    };
-
     /**
      * Handles form submission for creating or updating a purchase
      * If editing, updates existing document; otherwise creates new one
@@ -1,15 +1,36 @@
 import { doc, setDoc } from 'firebase/firestore';
 import { db } from '../firebase';
 
+const RECEIPT_ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789';
+// Largest multiple of the alphabet size below 256; higher bytes are redrawn to avoid modulo bias
+const RECEIPT_BYTE_LIMIT = 256 - (256 % RECEIPT_ALPHABET.length);
+
+/**
+ * Draws `count` uniformly distributed characters from RECEIPT_ALPHABET
+ * using rejection sampling over crypto.getRandomValues bytes
+ */
+const randomReceiptChars = (count: number): string => {
+    let out = '';
+    while (out.length < count) {
+        for (const b of crypto.getRandomValues(new Uint8Array(count))) {
+            if (b < RECEIPT_BYTE_LIMIT && out.length < count) {
+                out += RECEIPT_ALPHABET[b % RECEIPT_ALPHABET.length];
+            }
+        }
+    }
+    return out;
+};
+
 /**
  * Generates a unique receipt ID using timestamp and random characters
+ * Random part is drawn from the browser's CSPRNG (crypto.getRandomValues)
  * Format: RCP-YYYYMMDD-XXXX
  * Example: RCP-20260105-A3F9
  */
 export const generateReceiptId = (): string => {
     const date = new Date();
     const dateStr = date.toISOString().slice(0, 10).replace(/-/g, '');
-    const randomStr = Math.random().toString(36).substring(2, 6).toUpperCase();
+    const randomStr = randomReceiptChars(4);
     return `RCP-${dateStr}-${randomStr}`;
 };
 